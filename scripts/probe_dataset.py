@@ -8,22 +8,24 @@ examples, and insights for use in LLM experiments.
 
 import json
 import os
+import re
 import sys
 from pathlib import Path
 from typing import List, Dict, Set, Tuple
-from collections import Counter, defaultdict
-import matplotlib.pyplot as plt
-import seaborn as sns
+from collections import Counter
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+from pandas.api.typing import DataFrameGroupBy
 
 # Add src to path to import our modules
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
 try:
-    from hvadvilduhelst.load_hygdk import load_hygdk_dataset
+    from hvadvilduhelst.load_hygdk import load_hygdk_table
 except ImportError:
-    print("Warning: Could not import load_hygdk_dataset. Using fallback loader.")
+    print("Warning: Could not import load_hygdk_table. Using fallback loader.")
     
     def load_hygdk_dataset(data_dir: str = "../data/hygdk") -> List[Dict]:
         """Fallback dataset loader"""
@@ -43,25 +45,43 @@ except ImportError:
                     }
                     dataset.append(entry)
         return dataset
+    
+    def load_hygdk_table(data_dir: str = "../data/hygdk") -> pa.Table:
+        """Fallback Arrow table loader"""
+        return pa.Table.from_pylist(load_hygdk_dataset(data_dir))
+
+
+def build_analysis_frame(table: pa.Table) -> pd.DataFrame:
+    """
+    Build the DataFrame shared by all analyses, with every per-question
+    feature derived up front so the analyses only need to aggregate.
+    
+    Character lengths come from Arrow's utf8_length kernel, which yields int32
+    arrays directly; word counts are filled into a preallocated int32 array.
+    """
+    df = table.to_pandas()
+    df['category'] = df['category'].astype('category')
+    df['q_len'] = pc.utf8_length(table['questions']).to_numpy()
+    df['q_wc'] = np.fromiter(
+        (len(question.split()) for question in df['questions']), dtype=np.int32, count=len(df)
+    )
+    df['a_len'] = pc.utf8_length(table['answer_A']).to_numpy()
+    df['b_len'] = pc.utf8_length(table['answer_B']).to_numpy()
+    return df
 
 
-def analyze_dataset_structure(dataset: List[Dict]) -> Dict:
+def analyze_dataset_structure(df: pd.DataFrame, category_counts: pd.Series) -> Dict:
     """Analyze the basic structure of the dataset"""
     print("=" * 60)
     print("DATASET STRUCTURE ANALYSIS")
     print("=" * 60)
     
-    total_questions = len(dataset)
-    categories = set(item['category'] for item in dataset)
+    total_questions = len(df)
+    categories = set(category_counts.index)
     
     # Check for required fields
     required_fields = ['questions', 'answer_A', 'answer_B', 'category']
-    missing_fields = []
-    
-    for item in dataset[:10]:  # Check first 10 items
-        for field in required_fields:
-            if field not in item:
-                missing_fields.append(field)
+    missing_fields = [field for field in required_fields if field not in df.columns]
     
     structure_info = {
         'total_questions': total_questions,
@@ -83,25 +103,24 @@ def analyze_dataset_structure(dataset: List[Dict]) -> Dict:
     return structure_info
 
 
-def analyze_categories(dataset: List[Dict]) -> Dict:
+def analyze_categories(category_counts: pd.Series) -> Dict:
     """Analyze distribution across categories"""
     print("\n" + "=" * 60)
     print("CATEGORY ANALYSIS")
     print("=" * 60)
     
-    category_counts = Counter(item['category'] for item in dataset)
-    category_stats = dict(category_counts)
+    category_stats = {category: int(count) for category, count in category_counts.items()}
     
     print(f"Questions per Category:")
-    for category, count in sorted(category_counts.items()):
+    for category, count in category_stats.items():
         print(f"  {category:20} {count:3d} questions")
     
     # Statistical analysis
-    counts = list(category_counts.values())
+    counts = category_counts.to_numpy()
     mean_count = np.mean(counts)
     std_count = np.std(counts)
-    min_count = min(counts)
-    max_count = max(counts)
+    min_count = counts.min()
+    max_count = counts.max()
     
     print(f"\nCategory Statistics:")
     print(f"  Mean questions per category: {mean_count:.1f}")
@@ -125,71 +144,69 @@ def analyze_categories(dataset: List[Dict]) -> Dict:
     }
 
 
-def analyze_question_characteristics(dataset: List[Dict]) -> Dict:
+def analyze_question_characteristics(df: pd.DataFrame) -> Dict:
     """Analyze characteristics of questions and answers"""
     print("\n" + "=" * 60)
     print("QUESTION CHARACTERISTICS ANALYSIS")
     print("=" * 60)
     
-    # Question lengths
-    question_lengths = [len(item['questions']) for item in dataset]
-    answer_a_lengths = [len(item['answer_A']) for item in dataset]
-    answer_b_lengths = [len(item['answer_B']) for item in dataset]
+    # Length and word count statistics, reduced in a single pass over the precomputed columns
+    length_columns = {
+        'question_lengths': 'q_len',
+        'answer_a_lengths': 'a_len',
+        'answer_b_lengths': 'b_len',
+        'question_word_counts': 'q_wc'
+    }
+    stats = df[list(length_columns.values())].agg(['mean', 'median', 'min', 'max'])
     
-    # Word counts (approximate)
-    question_word_counts = [len(item['questions'].split()) for item in dataset]
+    # Common patterns: the first three words of each non-empty question, counted in one Counter pass
+    question_starters = Counter(
+        ' '.join(question.split(maxsplit=3)[:3]) for question in df['questions'] if question.strip()
+    )
     
-    # Common patterns
-    question_starters = Counter()
-    for item in dataset:
-        words = item['questions'].split()
-        if words:
-            first_few = ' '.join(words[:3])
-            question_starters[first_few] += 1
+    q_stats = stats['q_len']
+    a_stats = stats['a_len']
+    b_stats = stats['b_len']
+    w_stats = stats['q_wc']
     
     print("Question Length Statistics (characters):")
-    print(f"  Mean: {np.mean(question_lengths):.1f}")
-    print(f"  Median: {np.median(question_lengths):.1f}")
-    print(f"  Range: {min(question_lengths)} - {max(question_lengths)}")
+    print(f"  Mean: {q_stats['mean']:.1f}")
+    print(f"  Median: {q_stats['median']:.1f}")
+    print(f"  Range: {q_stats['min']:.0f} - {q_stats['max']:.0f}")
     
     print("\nAnswer Length Statistics (characters):")
-    print(f"  Answer A - Mean: {np.mean(answer_a_lengths):.1f}, Range: {min(answer_a_lengths)}-{max(answer_a_lengths)}")
-    print(f"  Answer B - Mean: {np.mean(answer_b_lengths):.1f}, Range: {min(answer_b_lengths)}-{max(answer_b_lengths)}")
+    print(f"  Answer A - Mean: {a_stats['mean']:.1f}, Range: {a_stats['min']:.0f}-{a_stats['max']:.0f}")
+    print(f"  Answer B - Mean: {b_stats['mean']:.1f}, Range: {b_stats['min']:.0f}-{b_stats['max']:.0f}")
     
     print("\nWord Count Statistics:")
-    print(f"  Mean words per question: {np.mean(question_word_counts):.1f}")
-    print(f"  Range: {min(question_word_counts)} - {max(question_word_counts)} words")
+    print(f"  Mean words per question: {w_stats['mean']:.1f}")
+    print(f"  Range: {w_stats['min']:.0f} - {w_stats['max']:.0f} words")
     
     print("\nMost Common Question Starters:")
     for starter, count in question_starters.most_common(10):
         print(f"  '{starter}': {count} times")
     
     return {
-        'length_stats': {
-            'question_lengths': question_lengths,
-            'answer_a_lengths': answer_a_lengths,
-            'answer_b_lengths': answer_b_lengths,
-            'question_word_counts': question_word_counts
-        },
+        'length_stats': {name: df[column] for name, column in length_columns.items()},
         'patterns': {
             'question_starters': dict(question_starters.most_common(10))
         }
     }
 
 
-def analyze_content_themes(dataset: List[Dict]) -> Dict:
+def analyze_content_themes(df: pd.DataFrame, by_category: DataFrameGroupBy) -> Dict:
     """Analyze content themes and topics"""
     print("\n" + "=" * 60)
     print("CONTENT THEMES ANALYSIS")
     print("=" * 60)
     
-    # Analyze by category
-    themes_by_category = defaultdict(list)
+    questions = df['questions'].str.lower()
     
-    for item in dataset:
-        category = item['category']
-        question = item['questions'].lower()
-        themes_by_category[category].append(question)
+    # Analyze by category
+    themes_by_category = {
+        category: questions.iloc[positions].tolist()
+        for category, positions in by_category.indices.items()
+    }
     
     # Look for common Danish words/themes
     danish_words = {
@@ -201,18 +218,20 @@ def analyze_content_themes(dataset: List[Dict]) -> Dict:
         'choice_intensity': ['helst', 'ville', 'eller', 'frem for']
     }
     
-    theme_counts = defaultdict(int)
-    for theme, words in danish_words.items():
-        for item in dataset:
-            question = item['questions'].lower()
-            for word in words:
-                if word in question:
-                    theme_counts[theme] += 1
-                    break  # Count each question only once per theme
+    # One alternation pattern per theme, so each question is scanned once per theme
+    patterns = {
+        theme: re.compile('|'.join(re.escape(word) for word in words))
+        for theme, words in danish_words.items()
+    }
+    
+    theme_counts = {
+        theme: int(questions.str.contains(pattern).sum())
+        for theme, pattern in patterns.items()
+    }
     
     print("Common Themes Found:")
     for theme, count in sorted(theme_counts.items(), key=lambda x: x[1], reverse=True):
-        percentage = (count / len(dataset)) * 100
+        percentage = (count / len(df)) * 100
         print(f"  {theme:15} {count:3d} questions ({percentage:.1f}%)")
     
     return {
@@ -221,31 +240,27 @@ def analyze_content_themes(dataset: List[Dict]) -> Dict:
     }
 
 
-def show_examples(dataset: List[Dict], n_examples: int = 3) -> None:
+def show_examples(by_category: DataFrameGroupBy, category_counts: pd.Series, n_examples: int = 3) -> None:
     """Show examples from each category"""
     print("\n" + "=" * 60)
     print("EXAMPLE QUESTIONS BY CATEGORY")
     print("=" * 60)
     
-    # Group by category
-    by_category = defaultdict(list)
-    for item in dataset:
-        by_category[item['category']].append(item)
+    # Take the first n_examples rows of each category in a single groupby pass
+    sample = by_category.head(n_examples)
     
     # Show examples from each category
-    for category in sorted(by_category.keys()):
-        items = by_category[category]
-        print(f"\n{category.upper()} ({len(items)} questions):")
+    for category, items in sample.groupby('category', sort=True, observed=True):
+        print(f"\n{category.upper()} ({category_counts[category]} questions):")
         print("-" * 40)
         
-        # Show first n_examples
-        for i, item in enumerate(items[:n_examples]):
-            print(f"{i+1}. {item['questions']}")
-            print(f"   A: {item['answer_A']}")
-            print(f"   B: {item['answer_B']}\n")
+        for i, item in enumerate(items.itertuples(index=False)):
+            print(f"{i+1}. {item.questions}")
+            print(f"   A: {item.answer_A}")
+            print(f"   B: {item.answer_B}\n")
 
 
-def detect_quality_issues(dataset: List[Dict]) -> Dict:
+def detect_quality_issues(df: pd.DataFrame) -> Dict:
     """Detect potential quality issues in the dataset"""
     print("\n" + "=" * 60)
     print("QUALITY ASSESSMENT")
@@ -259,28 +274,24 @@ def detect_quality_issues(dataset: List[Dict]) -> Dict:
         'missing_content': []
     }
     
-    seen_questions = set()
-    for i, item in enumerate(dataset):
-        question = item['questions']
-        
-        # Check for duplicates
-        if question in seen_questions:
-            issues['duplicate_questions'].append((i, question))
-        seen_questions.add(question)
-        
-        # Check for very short/long questions
-        if len(question) < 20:
-            issues['very_short_questions'].append((i, question))
-        elif len(question) > 200:
-            issues['very_long_questions'].append((i, question))
-        
-        # Check for duplicate answer options
-        if item['answer_A'] == item['answer_B']:
-            issues['duplicate_answers'].append((i, question))
-        
-        # Check for missing content
-        if not question.strip() or not item['answer_A'].strip() or not item['answer_B'].strip():
-            issues['missing_content'].append((i, question))
+    questions = df['questions']
+    question_lengths = df['q_len']
+    
+    # Each check is a boolean mask over the whole dataset, computed in one pass
+    masks = {
+        'duplicate_questions': questions.duplicated(),
+        'very_short_questions': question_lengths < 20,
+        'very_long_questions': question_lengths > 200,
+        'duplicate_answers': df['answer_A'] == df['answer_B'],
+        'missing_content': (
+            (questions.str.strip() == '')
+            | (df['answer_A'].str.strip() == '')
+            | (df['answer_B'].str.strip() == '')
+        )
+    }
+    
+    for issue_type, mask in masks.items():
+        issues[issue_type] = [(int(i), questions.iat[i]) for i in np.flatnonzero(mask)]
     
     # Report findings
     total_issues = sum(len(issue_list) for issue_list in issues.values())
@@ -301,14 +312,14 @@ def detect_quality_issues(dataset: List[Dict]) -> Dict:
     return issues
 
 
-def generate_experiment_recommendations(dataset: List[Dict], analysis_results: Dict) -> None:
+def generate_experiment_recommendations(df: pd.DataFrame, category_counts: pd.Series, analysis_results: Dict) -> None:
     """Generate recommendations based on dataset analysis"""
     print("\n" + "=" * 60)
     print("EXPERIMENT RECOMMENDATIONS")
     print("=" * 60)
     
-    total_questions = len(dataset)
-    num_categories = len(set(item['category'] for item in dataset))
+    total_questions = len(df)
+    num_categories = len(category_counts)
     
     print("Based on the dataset analysis, here are recommendations for your experiments:")
     print()
@@ -333,7 +344,6 @@ def generate_experiment_recommendations(dataset: List[Dict], analysis_results: D
     # Experiment 3: Category-Specific Patterns
     print("📊 EXPERIMENT 3: Category-Specific Disagreement Patterns")
     print("  Recommended approach:")
-    category_counts = Counter(item['category'] for item in dataset)
     balanced_categories = [cat for cat, count in category_counts.items() if count >= 35]
     
     print(f"  • Focus on {len(balanced_categories)} well-represented categories:")
@@ -372,36 +382,42 @@ def main():
     # Load dataset
     try:
         # Try relative path first
-        dataset = load_hygdk_dataset("../data/hygdk")
+        table = load_hygdk_table("../data/hygdk")
     except FileNotFoundError:
         try:
             # Try absolute path
-            dataset = load_hygdk_dataset()
+            table = load_hygdk_table()
         except FileNotFoundError:
             print("❌ Error: Could not find dataset files.")
             print("Make sure you're running from the scripts/ directory")
             print("and that the data/hygdk/ directory exists.")
             return
     
-    if not dataset:
+    if table.num_rows == 0:
         print("❌ Error: Dataset is empty or could not be loaded.")
         return
     
-    print(f"✅ Successfully loaded {len(dataset)} questions from dataset")
+    print(f"✅ Successfully loaded {table.num_rows} questions from dataset")
+    
+    df = build_analysis_frame(table)
+    
+    # Category counts and grouping are computed once and shared by the analyses below
+    category_counts = df['category'].value_counts().sort_index()
+    by_category = df.groupby('category', sort=True, observed=True)
     
     # Run all analyses
     analysis_results = {}
     
-    analysis_results['structure'] = analyze_dataset_structure(dataset)
-    analysis_results['categories'] = analyze_categories(dataset)
-    analysis_results['characteristics'] = analyze_question_characteristics(dataset)
-    analysis_results['themes'] = analyze_content_themes(dataset)
+    analysis_results['structure'] = analyze_dataset_structure(df, category_counts)
+    analysis_results['categories'] = analyze_categories(category_counts)
+    analysis_results['characteristics'] = analyze_question_characteristics(df)
+    analysis_results['themes'] = analyze_content_themes(df, by_category)
     
-    show_examples(dataset, n_examples=2)
+    show_examples(by_category, category_counts, n_examples=2)
     
-    analysis_results['quality_issues'] = detect_quality_issues(dataset)
+    analysis_results['quality_issues'] = detect_quality_issues(df)
     
-    generate_experiment_recommendations(dataset, analysis_results)
+    generate_experiment_recommendations(df, category_counts, analysis_results)
     create_visualization_suggestions(analysis_results)
     
     print("=" * 60)
@@ -1,7 +1,44 @@
-import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from itertools import chain
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+def _load_jsonl_file(file_path: Path) -> List[Dict]:
+    """
+    Load a single category JSONL file.
+    
+    Args:
+        file_path (Path): Path to the JSONL file; its stem is used as the category
+        
+    Returns:
+        List[Dict]: Entries from the file in the order they appear
+    """
+    # Get category name from filename (remove .jsonl extension)
+    category = file_path.stem
+    entries = []
+    
+    # Read the whole file at once and parse each non-empty line
+    for line in file_path.read_bytes().splitlines():
+        if not line.strip():
+            continue
+        data = orjson.loads(line)
+        entry = {
+            'questions': data['question'],
+            'answer_A': data['answer_A'],
+            'answer_B': data['answer_B'],
+            'category': category
+        }
+        entries.append(entry)
+    
+    return entries
+
 
 def load_hygdk_dataset(data_dir: str = "/Users/kasperjunge/gitrepo/datasets/hvadvilduhelst/data/hygdk") -> List[Dict]:
     """
@@ -13,24 +50,73 @@ def load_hygdk_dataset(data_dir: str = "/Users/kasperjunge/gitrepo/datasets/hvad
     Returns:
         List[Dict]: List of dictionaries containing questions, answers, and categories
     """
-    dataset = []
     data_path = Path(data_dir)
+    file_paths = list(data_path.glob("*.jsonl"))
+    
+    # Load the category files concurrently; map() keeps the file order.
+    # Each file is read with a single read_bytes() call, so the reads are
+    # already batched and overlapped here; a dedicated async backend such as
+    # io_uring would not gain anything for a few dozen small files.
+    max_workers = min(32, (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        chunks = list(executor.map(_load_jsonl_file, file_paths))
+    
+    return list(chain.from_iterable(chunks))
+
+
+def load_hygdk_table(data_dir: str = "/Users/kasperjunge/gitrepo/datasets/hvadvilduhelst/data/hygdk", cache_path: Optional[str] = None) -> pa.Table:
+    """
+    Load the hygdk dataset as an Arrow table, backed by a Parquet cache.
+    
+    The cache is rebuilt from the JSONL files whenever any of them (or the
+    directory itself, e.g. when a file is added or removed) is newer than it.
+    Writing the cache is best-effort: if it fails, the freshly loaded table is
+    still returned.
+    
+    Args:
+        data_dir (str): Path to the directory containing the JSONL files
+        cache_path (Optional[str]): Path to the Parquet cache file. Defaults to
+            a file next to the data directory named after it, e.g. data/hygdk.parquet
+        
+    Returns:
+        pa.Table: Table with questions, answer_A, answer_B and category columns
+    """
+    data_path = Path(data_dir)
+    cache_file = Path(cache_path) if cache_path else data_path.parent / f"{data_path.name}.parquet"
+    file_paths = list(data_path.glob("*.jsonl"))
+    
+    # Nothing to cache if there is no data
+    if not file_paths:
+        return pa.Table.from_pylist([])
+    
+    latest_mtime = max(path.stat().st_mtime for path in [data_path, *file_paths])
+    if cache_file.exists() and cache_file.stat().st_mtime >= latest_mtime:
+        return pq.read_table(cache_file, memory_map=True)
+    
+    table = pa.Table.from_pylist(load_hygdk_dataset(data_dir))
+    
+    # Write to a temporary file first so an interrupted or concurrent write
+    # never leaves a truncated cache in place
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        pq.write_table(table, tmp_file, compression="zstd")
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        with suppress(OSError):
+            tmp_file.unlink(missing_ok=True)
     
-    # Iterate through all JSONL files in the directory
-    for file_path in data_path.glob("*.jsonl"):
-        # Get category name from filename (remove .jsonl extension)
-        category = file_path.stem
+    return table
+
+
+def load_hygdk_dataset_cached(data_dir: str = "/Users/kasperjunge/gitrepo/datasets/hvadvilduhelst/data/hygdk", cache_path: Optional[str] = None) -> List[Dict]:
+    """
+    Load the hygdk dataset through the Parquet cache.
+    
+    Args:
+        data_dir (str): Path to the directory containing the JSONL files
+        cache_path (Optional[str]): Path to the Parquet cache file, see load_hygdk_table
         
-        # Read and process each line in the file
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                data = json.loads(line)
-                entry = {
-                    'questions': data['question'],
-                    'answer_A': data['answer_A'],
-                    'answer_B': data['answer_B'],
-                    'category': category
-                }
-                dataset.append(entry)
-    
-    return dataset
\ No newline at end of file
+    Returns:
+        List[Dict]: List of dictionaries containing questions, answers, and categories
+    """
+    return load_hygdk_table(data_dir, cache_path).to_pylist()
\ No newline at end of file
@@ -1,22 +1,24 @@
 import json
 import os
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Union
+import pyarrow as pa
 from datasets import Dataset
 from huggingface_hub import HfApi
 from dotenv import load_dotenv
-from hvadvilduhelst.load_hygdk import load_hygdk_dataset
+from hvadvilduhelst.load_hygdk import load_hygdk_table
 
 # Load environment variables from .env file
 load_dotenv()
 
 
-def upload_to_huggingface(dataset: List[Dict], split: str = "train") -> None:
+def upload_to_huggingface(dataset: Union[List[Dict], pa.Table], split: str = "train") -> None:
     """
     Upload the dataset to Hugging Face Hub.
     
     Args:
-        dataset (List[Dict]): The dataset to upload
+        dataset (Union[List[Dict], pa.Table]): The dataset to upload, either as a list
+            of dictionaries or as an Arrow table (e.g. from load_hygdk_table)
         split (str): The split name for the dataset (default: "train")
     """
     # Get token and repo_id from environment variables
@@ -28,8 +30,12 @@ def upload_to_huggingface(dataset: List[Dict], split: str = "train") -> None:
     if not repo_id:
         raise ValueError("HUGGINGFACE_REPO_ID environment variable not set")
     
-    # Convert the dataset to a Hugging Face Dataset
-    hf_dataset = Dataset.from_list(dataset)
+    # Convert the dataset to a Hugging Face Dataset. Arrow tables are wrapped
+    # as-is, skipping the row-by-row conversion needed for a list of dicts
+    if isinstance(dataset, pa.Table):
+        hf_dataset = Dataset(dataset)
+    else:
+        hf_dataset = Dataset.from_list(dataset)
     
     # Create a dictionary with the split
     dataset_dict = {split: hf_dataset}
@@ -45,7 +51,7 @@ def upload_to_huggingface(dataset: List[Dict], split: str = "train") -> None:
 
 if __name__ == "__main__":
     # Load the dataset
-    dataset = load_hygdk_dataset()
+    dataset = load_hygdk_table()
     
     # Upload to Hugging Face
     upload_to_huggingface(dataset=dataset) 
\ No newline at end of file